@@ -4,34 +4,53 @@ import utime
 import urequests
 
 
+CACHE_SECONDS = 60 * 60
+
+
+def read_cache(key):
+  try:
+    mtime = uos.stat(key)[8]
+    # a negative age means the RTC hasn't been set since boot
+    if 0 <= utime.time() - mtime < CACHE_SECONDS:
+      print('using cache')
+      with open(key) as f:
+        return ujson.loads(f.read())
+    else:
+      print('cache out of date')
+  except:
+    print('error accessing cache')
+
+
+def write_cache(key, content):
+  with open(key, 'w') as f:
+    f.write(content)
+
+
 class BOM:
   def __init__(self, geohash):
     self.geohash = geohash
 
-  def _get(self, thing):
-    key = 'cache-{}-{}.json'.format(self.geohash, thing).replace('/', '__')
-    try:
-      mtime = uos.stat(key)[8]
-      if utime.time() - mtime < 60 * 60:
-        print('using cache')
-        with open(key) as f:
-          return ujson.loads(f.read())
-      else:
-        print('cache out of date')
-    except:
-      print('error accessing cache')
+  def cache_key(self, thing):
+    return 'cache-{}-{}.json'.format(self.geohash, thing).replace('/', '__')
+
+  def _get(self, thing, cache=True):
+    key = self.cache_key(thing)
+    if cache:
+      data = read_cache(key)
+      if data is not None:
+        return data
 
     url = 'https://api.weather.bom.gov.au/v1/locations/{}/{}'.format(self.geohash, thing)
     r = urequests.get(url)
     try:
-      with open(key, 'w') as f:
-        f.write(r.content)
+      if cache:
+        write_cache(key, r.content)
       return r.json()
     finally:
       r.close()
 
-  def forecasts_3_hourly(self):
-    return self._get('forecasts/3-hourly')
+  def forecasts_3_hourly(self, cache=True):
+    return self._get('forecasts/3-hourly', cache)
 
   def __getattr__(self, name):
-    return lambda: self._get(name.replace('_', '/'))
\ No newline at end of file
+    return lambda cache=True: self._get(name.replace('_', '/'), cache)
@@ -19,6 +19,9 @@ OR = (8, 4, 0)
 DO = (5, 2, 0)
 BG = (1, 1, 3)
 
+SCROLL_DELAY = 150
+SCROLL_HOLD = 300
+
 
 class Display:
   def __init__(self):
@@ -51,36 +54,33 @@ class Display:
   def show_weather(self, name):
     self.show_image(BOM_ICONS.get(name, DEFAULT_BOM_ICON))
 
-  def scroll_text(self, text, colour=RE, delay=150, times=1):
+  def scroll_text(self, text, colour=RE, delay=SCROLL_DELAY, times=1, hold=SCROLL_HOLD):
     with self.lock:
       # since start_new_thread isn't actually Python compatible,
       # we can't take the thread identifier from the return value
       # and have to get it inside the thread.
       # But we need this here to mark us as 'scrolling' ASAP.
       self.scrolling = 'fake'
-      _thread.start_new_thread(self._scroll_text, [text, colour, delay, times])
+      _thread.start_new_thread(self._scroll_text, [text, colour, delay, times, hold])
 
   @contextmanager
-  def scroll_status(self, text, colour=RE, delay=150, times=1):
-    self.scroll_text(text, colour, delay)
+  def scroll_status(self, text, colour=RE, delay=SCROLL_DELAY, times=1, hold=SCROLL_HOLD):
+    self.scroll_text(text, colour, delay, times, hold)
     yield self
     self.clear()
 
-  def _scroll_text(self, text, colour, delay, times):
+  def _scroll_text(self, text, colour, delay, times, hold):
     with self.lock:
       self.scrolling = _thread.get_ident()
 
     try:
       for _ in range(times):
-        self._scroll_text_inner(text, colour, delay)
+        self._scroll_text_inner(text, colour, delay, hold)
     finally:
       with self.lock:
         if self.scrolling == _thread.get_ident():
           self.scrolling = None
 
-  def get_image_for_char(self, c, colour):
-    return [colour if v else [0, 0, 0] for v in CHAR_DATA.get(c, CHAR_DATA['?'])] + [__] * 5
-
   def _display_buf(self, buf):
     with self.lock:
       if self.scrolling != _thread.get_ident():
@@ -91,22 +91,25 @@ class Display:
     self.np.write()
     return True
 
-  def _scroll_text_inner(self, text, colour, delay):
-    buf = self.get_image_for_char(text[0], colour)[:25]
+  def _scroll_text_inner(self, text, colour, delay, hold):
+    # Pad with a screen of blank columns so the text scrolls fully off.
+    columns = text_columns(text) + [0] * 5
+
+    # buf[0:5] is the rightmost column, buf[20:25] the leftmost.
+    buf = []
+    for col in reversed(columns[:5]):
+      buf.extend(colour if col >> y & 1 else __ for y in range(5))
     if not self._display_buf(buf):
       return
-    sleep_ms(500)
+    sleep_ms(hold)
 
-    for c in text[1:] + ' ':
-      image = self.get_image_for_char(c, colour)
+    for col in columns[5:]:
+      buf[5:] = buf[:20]
+      buf[0:5] = [colour if col >> y & 1 else __ for y in range(5)]
+      if not self._display_buf(buf):
+        return
 
-      for i in range(6):
-        buf[5:] = buf[:20]
-        buf[0:5] = image[25 - (i * 5):30 - (i * 5)]
-        if not self._display_buf(buf):
-          return
-
-        sleep_ms(delay)
+      sleep_ms(delay)
 
   def flush(self):
     with self.lock:
@@ -251,6 +254,62 @@ CHAR_DATA = {
     ' ': [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 }
 
+
+def _glyph_columns(data):
+  # One int per column, left to right, bit y set if row y is lit.
+  # Blank columns either side are trimmed so narrow glyphs stay narrow.
+  columns = []
+  for x in range(5):
+    col = 0
+    for y in range(5):
+      if data[(4 - x) * 5 + y]:
+        col |= 1 << y
+    columns.append(col)
+  while columns and not columns[0]:
+    columns.pop(0)
+  while columns and not columns[-1]:
+    columns.pop()
+  return tuple(columns)
+
+
+CHAR_COLUMNS = {c: _glyph_columns(data) for (c, data) in CHAR_DATA.items()}
+CHAR_COLUMNS[' '] = (0, 0)
+# only needed to build CHAR_COLUMNS, so don't keep both tables in RAM
+del CHAR_DATA
+
+
+def char_gap(left, right):
+  """
+  Blank columns to put between two glyphs (as in CHAR_COLUMNS).
+
+  Glyphs are butted together when the facing columns have no lit
+  pixels on the same or a neighbouring row (e.g. '1-', 'T4'),
+  otherwise they get the usual single blank column.
+  """
+  edge = right[0]
+  if left[-1] & (edge << 1 | edge | edge >> 1):
+    return 1
+  return 0
+
+
+def text_columns(text):
+  """Pack text into a list of column ints, using each glyph's own width."""
+  columns = []
+  prev = None
+  for c in text:
+    glyph = CHAR_COLUMNS.get(c, CHAR_COLUMNS['?'])
+    if prev is not None:
+      columns.extend([0] * char_gap(prev, glyph))
+    columns.extend(glyph)
+    prev = glyph
+  return columns
+
+
+def scroll_duration(text, delay=SCROLL_DELAY, times=1, hold=SCROLL_HOLD):
+  """Milliseconds Display.scroll_text(text, ...) will keep the display busy."""
+  return (hold + len(text_columns(text)) * delay) * times
+
+
 BOM_ICONS = {
   'sunny': (
     YE, __, YE, __, YE,
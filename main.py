@@ -4,7 +4,8 @@ from graphics import Display
 import graphics
 import time
 import ujson
-from bom import BOM
+import gc
+from bom import BOM, read_cache, write_cache
 import machine
 from machine import deepsleep, lightsleep, Pin
 import esp32
@@ -34,13 +35,21 @@ def wifi_connect(ap, password):
     sta_if.active(False)
 
 
+def bom_data_key(geohash):
+  # Only the few values we display are cached per location; the full
+  # BOM response isn't written to flash at all.
+  return 'data-{}.json'.format(geohash)
+
+
+def get_cached_bom_data(geohash):
+  data = read_cache(bom_data_key(geohash))
+  return None if data is None else tuple(data)
+
+
 def get_bom_data(geohash):
   bom = BOM(geohash)
 
-  observations = bom.observations()['data']
-  temp_now = observations['temp']
-  rain_since_9am = observations['rain_since_9am']
-  forecast = bom.forecasts_daily()['data'][0]
+  forecast = bom.forecasts_daily(cache=False)['data'][0]
   # Stupid hack... should just check time > 4pm or something
   #forecast = tomorrow if today['now']['is_night'] else today
   # bizarrely, temp_now often holds the overnight min (?)
@@ -48,7 +57,27 @@ def get_bom_data(geohash):
   temp_max = forecast['temp_max']
   icon = forecast['icon_descriptor']
   rain = forecast['rain']['amount']['max'] or forecast['rain']['amount']['min']
-  return (temp_min, temp_max, icon, rain)
+  data = (temp_min, temp_max, icon, rain)
+  write_cache(bom_data_key(geohash), ujson.dumps(data))
+  return data
+
+
+def get_all_bom_data(geohashes, locations):
+  # Fills in the None entries of locations (one per geohash) in place.
+  # Locations that still fail stay None, so later ones keep their
+  # position, rather than taking the others down with them.
+  for (i, geohash) in enumerate(geohashes):
+    if locations[i] is not None:
+      continue
+    print('Loading', geohash)
+    try:
+      locations[i] = get_bom_data(geohash)
+    except Exception as e:
+      print('Failed to load', geohash)
+      sys.print_exception(e)
+    gc.collect()
+  if all(data is None for data in locations):
+    raise Exception('bom fail')
 
 
 button_a = Pin(35, Pin.IN)
@@ -62,15 +91,18 @@ class WeatherDisplay:
   MAX = 3
 
   RAINBOW = 10
+  LOCATION = 11
 
-  def __init__(self, display, temp_min, temp_max, icon, rain):
+  def __init__(self, display, locations):
     self.state = self.ICON
     self.display = display
     self.last_interaction = time.ticks_ms()
-    self.temp_min = temp_min
-    self.temp_max = temp_max
-    self.icon = icon
-    self.rain = rain
+    # list of (temp_min, temp_max, icon, rain), one per geohash,
+    # or None where that location failed to load
+    self.locations = locations
+    self.location = 0
+    while locations[self.location] is None:
+      self.location += 1
     button_a.irq(trigger=Pin.IRQ_FALLING, handler=self.button_press, wake=machine.SLEEP | machine.DEEPSLEEP)
     button_b.irq(trigger=Pin.IRQ_FALLING, handler=self.button_press, wake=machine.SLEEP | machine.DEEPSLEEP)
     esp32.wake_on_ext0(button_a, esp32.WAKEUP_ALL_LOW)
@@ -90,21 +122,43 @@ class WeatherDisplay:
           self.state = (self.state + 1) % self.MAX
     elif pin == button_b:
       if pin.value() == 0:
-        self.state = self.RAINBOW
+        # step through the locations, then the rainbow, then back to the first
+        if len(self.locations) == 1:
+          self.state = self.RAINBOW
+        elif self.state == self.RAINBOW:
+          self.location = 0
+          self.state = self.LOCATION
+        elif self.location + 1 < len(self.locations):
+          self.location += 1
+          self.state = self.LOCATION
+        else:
+          self.state = self.RAINBOW
 
   def run(self):
     old_state = None
     while True:
-      if self.state != old_state:
-        if self.state == self.ICON:
-          display.show_weather(self.icon)
-        elif self.state == self.TEMP:
-          display.scroll_text('T{}-{}'.format(self.temp_min, self.temp_max), graphics.RE)
-        elif self.state == self.RAIN:
-          display.scroll_text('R{}'.format(self.rain), graphics.BL)
-        elif self.state == self.RAINBOW:
+      # read once, since the button handler can change these under us
+      state_id = self.state
+      location = self.location
+      state = (state_id, location)
+      if state != old_state:
+        data = self.locations[location]
+        if data is None:
+          temp_min = temp_max = rain = '?'
+          icon = None
+        else:
+          temp_min, temp_max, icon, rain = data
+        if state_id == self.ICON:
+          display.show_weather(icon)
+        elif state_id == self.TEMP:
+          display.scroll_text('T{}-{}'.format(temp_min, temp_max), graphics.RE)
+        elif state_id == self.RAIN:
+          display.scroll_text('R{}'.format(rain), graphics.BL)
+        elif state_id == self.LOCATION:
+          display.scroll_text('L{}{}'.format(location + 1, '' if data else '?'), graphics.GR)
+        elif state_id == self.RAINBOW:
           display.show_rainbow()
-        old_state = self.state
+        old_state = state
 
       if not display.is_scrolling() and self.state not in (self.ICON, self.RAINBOW):
         self.state = self.ICON
@@ -128,21 +182,31 @@ if __name__ == '__main__':
   with open('config.json') as f:
     config = ujson.loads(f.read())
 
-  # TODO don't connect to wifi if the RTC is set
-  # AND we have cached data.
-  print('Connecting to wifi...')
-  with display.scroll_status('wifi...'):
-    wifi = wifi_connect(config['ap'], config['password'])
-
-  with wifi:
-    print('Setting time...')
-    with display.scroll_status('time...'):
-      ntptime.settime()
-    print('Loading data from BOM...')
-    with display.scroll_status('bom...'):
-      data = get_bom_data(config['bom_geohash'])
+  # bom_geohash can be a single geohash or a list of them
+  geohashes = config['bom_geohash']
+  if isinstance(geohashes, str):
+    geohashes = [geohashes]
+  if not geohashes:
+    raise Exception('no bom_geohash configured')
+
+  # The caches only count as fresh once the RTC has been set, so if
+  # every location is cached we can skip wifi and NTP altogether.
+  locations = [get_cached_bom_data(geohash) for geohash in geohashes]
+
+  if None in locations:
+    print('Connecting to wifi...')
+    with display.scroll_status('wifi...'):
+      wifi = wifi_connect(config['ap'], config['password'])
+
+    with wifi:
+      print('Setting time...')
+      with display.scroll_status('time...'):
+        ntptime.settime()
+      print('Loading data from BOM...')
+      with display.scroll_status('bom...'):
+        get_all_bom_data(geohashes, locations)
 
   print('Configuring display...')
-  wd = WeatherDisplay(display, *data)
+  wd = WeatherDisplay(display, locations)
   print('Running...')
   wd.run()